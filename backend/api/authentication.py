@@ -0,0 +1,14 @@
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+
+class AdminFlagJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication that stamps is_admin on the user once per request.
+
+    Views then read request.user.is_admin instead of re-deriving
+    is_staff/is_superuser at every check.
+    """
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+        user.is_admin = user.is_staff or user.is_superuser
+        return user
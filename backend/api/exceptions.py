@@ -0,0 +1,38 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+
+from .utils.logging_utility import log_error
+
+
+def envelope_handler(exc, context):
+    """Wrap DRF's exception responses in the standard response envelope.
+
+    The views only catch what they can answer for, so everything else -
+    auth/permission failures, the paginator's invalid-page NotFound, and
+    any unexpected view bug - lands here and keeps the
+    {'status', 'message'} contract the API has always returned.
+    """
+    response = exception_handler(exc, context)
+    if response is None:
+        # Not an API exception; baseline answered these with the JSON
+        # envelope too, so log and keep that contract instead of falling
+        # through to Django's plain 500
+        log_error("Unhandled exception in API view", exc)
+        return Response({
+            'status': 'error',
+            'message': str(exc)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    if isinstance(response.data, dict) and 'detail' in response.data:
+        response.data = {
+            'status': 'error',
+            'message': str(response.data['detail'])
+        }
+    else:
+        response.data = {
+            'status': 'error',
+            'message': 'Request failed.',
+            'errors': response.data
+        }
+    return response
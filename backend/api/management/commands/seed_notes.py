@@ -0,0 +1,35 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from api.models import Note
+
+
+class Command(BaseCommand):
+    help = "Seed the database with notes for a user, using batched bulk_create"
+
+    def add_arguments(self, parser):
+        parser.add_argument('username', help="Author for the seeded notes")
+        parser.add_argument('--count', type=int, default=100,
+                            help="How many notes to create (default: 100)")
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help="Rows per INSERT batch (default: 500)")
+
+    def handle(self, *args, **options):
+        try:
+            author = User.objects.get(username=options['username'])
+        except User.DoesNotExist:
+            raise CommandError(f"User '{options['username']}' does not exist")
+
+        # One multi-row INSERT per batch instead of one query per note
+        notes = (
+            Note(
+                title=f"Seeded note {i}",
+                content=f"Auto-generated content for note {i}",
+                author=author,
+            )
+            for i in range(options['count'])
+        )
+        Note.objects.bulk_create(notes, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {options['count']} notes for {author.username}"
+        ))
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.17 on 2026-08-26 18:17
+
+import django.core.validators
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_alter_note_options_alter_note_content_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='note',
+            name='content',
+            field=models.TextField(validators=[django.core.validators.MinLengthValidator(1, message='El contenido no puede estar vacio')]),
+        ),
+        migrations.AlterField(
+            model_name='note',
+            name='title',
+            field=models.CharField(max_length=100, validators=[django.core.validators.MinLengthValidator(1, message='El titulo no puede estar vacio')]),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['-created_at'], name='note_created_desc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['author', '-created_at'], name='note_author_created_idx'),
+        ),
+    ]
@@ -21,4 +21,10 @@ class Note(models.Model):
         return self.title
 
     class Meta:
-        ordering = ['-created_at']  
\ No newline at end of file
+        ordering = ['-created_at']
+        indexes = [
+            # Serves the global newest-first listing
+            models.Index(fields=['-created_at'], name='note_created_desc_idx'),
+            # Serves per-author newest-first scans (admin list filter, profiles)
+            models.Index(fields=['author', '-created_at'], name='note_author_created_idx'),
+        ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import User
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from .models import Note
 
 class UserSerializer(serializers.ModelSerializer):
@@ -12,11 +13,45 @@ class UserSerializer(serializers.ModelSerializer):
         user = User.objects.create_user(**validated_data)
         return user
     
+class TokenObtainPairWithClaimsSerializer(TokenObtainPairSerializer):
+    """Embed the fields /api/user/me/ needs as token claims.
+
+    CurrentUserView can then answer straight from the validated token
+    without touching the database.
+    """
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['username'] = user.username
+        token['is_staff'] = user.is_staff
+        token['is_superuser'] = user.is_superuser
+        return token
+
 class NoteSerializer(serializers.ModelSerializer):
     author_username = serializers.CharField(source='author.username', read_only=True)
     author_id = serializers.IntegerField(source='author.id', read_only=True)
-    
+
     class Meta:
         model = Note
         fields = ['id', 'title', 'content', 'created_at', 'author', 'author_username', 'author_id']
-        extra_kwargs = {'author': {'read_only': True}}
\ No newline at end of file
+        extra_kwargs = {'author': {'read_only': True}}
+
+# Columns the list endpoint pulls with .values(); kept in sync with
+# note_row_to_dict below
+NOTE_LIST_VALUES = ('id', 'title', 'content', 'created_at', 'author_id', 'author__username')
+
+def note_row_to_dict(row):
+    """Shape a Note .values() row like NoteSerializer output.
+
+    The read path skips model instantiation and the DRF field machinery
+    entirely; this is much cheaper per note than NoteSerializer.
+    """
+    return {
+        'id': row['id'],
+        'title': row['title'],
+        'content': row['content'],
+        'created_at': row['created_at'],
+        'author': row['author_id'],
+        'author_username': row['author__username'],
+        'author_id': row['author_id'],
+    }
\ No newline at end of file
@@ -0,0 +1,10 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+
+@receiver(post_save, sender=User)
+def invalidate_current_user_cache(sender, instance, **kwargs):
+    """Drop the cached /user/me/ payload whenever a user record changes"""
+    cache.delete(f"curuser:{instance.id}")
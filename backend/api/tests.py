@@ -1,4 +1,4 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth.models import User
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
@@ -8,20 +8,28 @@ from .models import Note
 from .serializers import NoteSerializer, UserSerializer
 import json
 
+# The default PBKDF2 hasher is deliberately slow; tests don't need that,
+# so every class that creates users runs with a fast hasher instead
+fast_password_hashing = override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']
+)
 
+
+@fast_password_hashing
 class NoteModelTestCase(TestCase):
     """Sample test cases for somethings and some others"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class"""
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
-        self.note = Note.objects.create(
+        cls.note = Note.objects.create(
             title='Test Note',
             content='This is a test note content',
-            author=self.user
+            author=cls.user
         )
     
     def test_note_creation(self):
@@ -48,18 +56,20 @@ class NoteModelTestCase(TestCase):
             note.full_clean()
 
 
+@fast_password_hashing
 class NoteSerializerTestCase(TestCase):
     """Test cases for Note serializer"""
     
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
-        self.note = Note.objects.create(
+        cls.note = Note.objects.create(
             title='Test Note',
             content='Test content',
-            author=self.user
+            author=cls.user
         )
     
     def test_note_serialization(self):
@@ -83,6 +93,7 @@ class NoteSerializerTestCase(TestCase):
         self.assertTrue(serializer.is_valid())
 
 
+@fast_password_hashing
 class UserSerializerTestCase(TestCase):
     """Test cases for the User serializer"""
     
@@ -106,39 +117,89 @@ class UserSerializerTestCase(TestCase):
         self.assertNotIn('password', serializer.data)
 
 
+@fast_password_hashing
+class QueryCountRegressionTestCase(APITestCase):
+    """Pin the number of queries on the hot endpoints so N+1s can't sneak back in"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_user(
+            username='admin',
+            password='adminpass123',
+            is_staff=True,
+            is_superuser=True
+        )
+        Note.objects.bulk_create([
+            Note(title=f'Note {i}', content=f'Content {i}', author=cls.admin_user)
+            for i in range(5)
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def authenticate(self, user):
+        from .serializers import TokenObtainPairWithClaimsSerializer
+        token = TokenObtainPairWithClaimsSerializer.get_token(user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {str(token)}')
+
+    def test_list_notes_query_count(self):
+        """Listing is auth + paginator count + one page of rows, regardless of size"""
+        self.authenticate(self.admin_user)
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('note-list'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_delete_note_query_count(self):
+        """Deleting fetches the note (author joined in) once, then deletes"""
+        note = Note.objects.first()
+        self.authenticate(self.admin_user)
+        with self.assertNumQueries(3):
+            response = self.client.delete(reverse('delete-note', kwargs={'pk': note.pk}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_current_user_query_count(self):
+        """With claims in the token, /user/me/ only pays the auth lookup"""
+        self.authenticate(self.admin_user)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('current-user'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # simplejwt stores user_id as a string claim; the id must come
+        # back as an int like the non-claims path returns it
+        self.assertEqual(response.data['data']['id'], self.admin_user.id)
+
+
+@fast_password_hashing
 class NoteAPITestCase(APITestCase):
     """Test cases for Note API endpoints"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.client = APIClient()
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Set up shared fixtures once; per-test changes roll back"""
         # Regular user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
-        
+
         # Admin user
-        self.admin_user = User.objects.create_user(
+        cls.admin_user = User.objects.create_user(
             username='admin',
             password='adminpass123',
             is_staff=True,
             is_superuser=True
         )
-        
-        # Test notes
-        self.note1 = Note.objects.create(
-            title='Note 1',
-            content='Content 1',
-            author=self.user
-        )
-        
-        self.note2 = Note.objects.create(
-            title='Note 2',
-            content='Content 2',
-            author=self.admin_user
-        )
+
+        # Test notes, inserted in one batch; pks come back via RETURNING so
+        # the per-test assertions can still address them. ignore_conflicts
+        # is deliberately not used here because it would drop the pks, and
+        # a fresh test database has nothing to conflict with anyway
+        cls.note1, cls.note2 = Note.objects.bulk_create([
+            Note(title='Note 1', content='Content 1', author=cls.user),
+            Note(title='Note 2', content='Content 2', author=cls.admin_user),
+        ])
+
+    def setUp(self):
+        self.client = APIClient()
     
     def get_jwt_token(self, user):
         refresh = RefreshToken.for_user(user)
@@ -152,8 +213,22 @@ class NoteAPITestCase(APITestCase):
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 2)  # Should see all notes
+        # data holds the paginated dict: count/next/previous/results
+        self.assertEqual(response.data['data']['count'], 2)
+        self.assertEqual(len(response.data['data']['results']), 2)  # Should see all notes
     
+    def test_list_notes_invalid_page(self):
+        """An out-of-range page comes back as a 404 in the error envelope"""
+        token = self.get_jwt_token(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+        url = reverse('note-list')
+        response = self.client.get(url, {'page': 999})
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data['status'], 'error')
+        self.assertIn('message', response.data)
+
     def test_list_notes_unauthenticated(self):
         url = reverse('note-list')
         response = self.client.get(url)
@@ -212,7 +287,7 @@ class NoteAPITestCase(APITestCase):
         response = self.client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertEqual(Note.objects.filter(pk=self.note1.pk).count(), 0)
+        self.assertFalse(Note.objects.filter(pk=self.note1.pk).exists())
     
     def test_delete_note_as_regular_user(self):
         """Deleting a note as regular user"""
@@ -223,7 +298,7 @@ class NoteAPITestCase(APITestCase):
         response = self.client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-        self.assertEqual(Note.objects.filter(pk=self.note1.pk).count(), 1)
+        self.assertTrue(Note.objects.filter(pk=self.note1.pk).exists())
     
     def test_delete_nonexistent_note(self):
         """Deleting a unexisting (is it spell like that?) note"""
@@ -236,21 +311,25 @@ class NoteAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
+@fast_password_hashing
 class CurrentUserAPITestCase(APITestCase):
     """Test cases for CurrentUser API endpoint"""
     
-    def setUp(self):
-        self.client = APIClient()
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
-        self.admin_user = User.objects.create_user(
+        cls.admin_user = User.objects.create_user(
             username='admin',
             password='adminpass123',
             is_staff=True,
             is_superuser=True
         )
+
+    def setUp(self):
+        self.client = APIClient()
     
     def get_jwt_token(self, user):
         """Helper method to get JWT token for a user"""
@@ -297,6 +376,7 @@ class CurrentUserAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+@fast_password_hashing
 class UserRegistrationAPITestCase(APITestCase):
     """Test cases for User registration API"""
     
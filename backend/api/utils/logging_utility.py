@@ -1,23 +1,30 @@
+import functools
 import logging
 
+from django.conf import settings
+
 info_logger = logging.getLogger('notes_app.info')
 warning_logger = logging.getLogger('notes_app.warning')
 error_logger = logging.getLogger('notes_app.error')
 general_logger = logging.getLogger('notes_app')
 
-def log_info(message, extra_data=None):
-    """Log info level messages"""
+def _verbose_logging_enabled():
+    """Per-call logging is only worth its cost in DEBUG or when explicitly enabled"""
+    return settings.DEBUG or getattr(settings, 'VERBOSE_API_LOGGING', False)
+
+def log_info(message, *args, extra_data=None):
+    """Log info level messages (lazy %s-style args are formatted only if emitted)"""
     if extra_data:
-        info_logger.info(f"{message} - Extra data: {extra_data}")
+        info_logger.info(f"{message} - Extra data: {extra_data}", *args)
     else:
-        info_logger.info(message)
+        info_logger.info(message, *args)
 
-def log_warning(message, extra_data=None):
+def log_warning(message, *args, extra_data=None):
     """Log warning level messages"""
     if extra_data:
-        warning_logger.warning(f"{message} - Extra data: {extra_data}")
+        warning_logger.warning(f"{message} - Extra data: {extra_data}", *args)
     else:
-        warning_logger.warning(message)
+        warning_logger.warning(message, *args)
 
 def log_error(message, exception=None, extra_data=None):
     """Log error level messages"""
@@ -28,25 +35,57 @@ def log_error(message, exception=None, extra_data=None):
         error_message += f" - Extra data: {extra_data}"
     error_logger.error(error_message, exc_info=exception is not None)
 
-def log_debug(message, extra_data=None):
+def log_debug(message, *args, extra_data=None):
     """Log debug level messages"""
     if extra_data:
-        general_logger.debug(f"{message} - Extra data: {extra_data}")
+        general_logger.debug(f"{message} - Extra data: {extra_data}", *args)
     else:
-        general_logger.debug(message)
+        general_logger.debug(message, *args)
+
+def log_function_call(function_name):
+    """Decorator flavor of LogFunctionCall for view methods.
+
+    The verbose-logging check runs once at decoration time. When it is
+    off, the wrapper is a bare try/except that only writes to the error
+    log on unexpected exceptions, so the happy path pays nothing for the
+    enter/exit instrumentation but failures still reach the error log.
+    """
+    def decorator(func):
+        if not _verbose_logging_enabled():
+            @functools.wraps(func)
+            def quiet_wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    log_error(f"Function {function_name} failed", e)
+                    raise
+            return quiet_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            request = args[1] if len(args) > 1 else None
+            user_id = getattr(getattr(request, 'user', None), 'id', None)
+            with LogFunctionCall(function_name, user_id):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
 
 class LogFunctionCall:
     def __init__(self, function_name, user_id=None):
         self.function_name = function_name
         self.user_id = user_id
-    
+        # No-op in production unless VERBOSE_API_LOGGING is set, so the
+        # enter/exit log lines cost nothing on hot endpoints
+        self.enabled = _verbose_logging_enabled()
+
     def __enter__(self):
-        user_info = f" (User: {self.user_id})" if self.user_id else ""
-        log_info(f"Entering function: {self.function_name}{user_info}")
+        if self.enabled:
+            user_info = f" (User: {self.user_id})" if self.user_id else ""
+            log_info(f"Entering function: {self.function_name}{user_info}")
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type:
             log_error(f"Function {self.function_name} failed", exc_val)
-        else:
-            log_info(f"Function {self.function_name} completed successfully")
\ No newline at end of file
+        elif self.enabled:
+            log_info(f"Function {self.function_name} completed successfully")
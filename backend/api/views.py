@@ -1,202 +1,218 @@
 from django.shortcuts import render
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.http import Http404
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from .serializers import UserSerializer, NoteSerializer
+from rest_framework.pagination import PageNumberPagination
+from .serializers import UserSerializer, NoteSerializer, NOTE_LIST_VALUES, note_row_to_dict
 from .models import Note
 from .utils.logging_utility import (
-    log_info, log_warning, log_error, log_debug, LogFunctionCall
+    log_info, log_warning, log_error, log_function_call
 )
 
+def _is_admin(user):
+    # AdminFlagJWTAuthentication precomputes this; fall back for users
+    # authenticated some other way (e.g. session auth in the browsable API)
+    return getattr(user, 'is_admin', None) or user.is_staff or user.is_superuser
+
+class NotePagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
 class NoteListCreate(generics.ListCreateAPIView):
     serializer_class = NoteSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = NotePagination
 
     def get_queryset(self):
-        with LogFunctionCall("NoteListCreate.get_queryset", self.request.user.id):
-            try:
-                queryset = Note.objects.select_related('author').all().order_by('-created_at')
-                log_info(f"Retrieved {queryset.count()} notes for user {self.request.user.username}")
-                return queryset
-            except Exception as e:
-                log_error("Failed to retrieve notes", e)
-                raise
-    
+        return Note.objects.select_related('author').order_by('-created_at')
+
+    @log_function_call("NoteListCreate.list")
     def list(self, request, *args, **kwargs):
-        with LogFunctionCall("NoteListCreate.list", request.user.id):
-            try:
-                queryset = self.get_queryset()
-                serializer = self.get_serializer(queryset, many=True)
-                return Response({
-                    'status': 'success',
-                    'message': 'Notes retrieved successfully.',
-                    'data': serializer.data
-                }, status=status.HTTP_200_OK)
-            except Exception as e:
-                log_error("Error retrieving notes", e)
-                return Response({
-                    'status': 'error', 
-                    'message': str(e)
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-    
-    def perform_create(self, serializer):
-        with LogFunctionCall("NoteListCreate.perform_create", self.request.user.id):
-            try:
-                if serializer.is_valid():
-                    note = serializer.save(author=self.request.user)
-                    log_info(f"Note created successfully - ID: {note.id}, Title: '{note.title}', Author: {self.request.user.username}")
-                else:
-                    log_warning(f"Invalid note creation attempt by user {self.request.user.username}", 
-                               {"errors": serializer.errors})
-                    print(serializer.errors)
-            except Exception as e:
-                log_error(f"Error creating note for user {self.request.user.username}", e)
-                raise
+        # Unexpected failures propagate to DRF's exception handler.
+        # .values() narrows the rows to just the serialized columns
+        queryset = self.get_queryset().values(*NOTE_LIST_VALUES)
+        page = self.paginate_queryset(queryset)
+        data = [note_row_to_dict(row) for row in page]
+        log_info("Retrieved %s notes for user %s", len(data), request.user.username)
+        response = Response({
+            'status': 'success',
+            'message': 'Notes retrieved successfully.',
+            'data': self.get_paginated_response(data).data
+        }, status=status.HTTP_200_OK)
+        # max-age=0 makes clients revalidate with If-None-Match each time;
+        # ConditionalGetMiddleware answers unchanged pages with a bodyless 304
+        response['Cache-Control'] = 'private, max-age=0'
+        return response
     
+    @log_function_call("NoteListCreate.create")
     def create(self, request, *args, **kwargs):
-        with LogFunctionCall("NoteListCreate.create", request.user.id):
-            try:
-                serializer = self.get_serializer(data=request.data)
-                if serializer.is_valid():
-                    note = serializer.save(author=request.user)
-                    log_info(f"Note created successfully - ID: {note.id}, Title: '{note.title}', Author: {request.user.username}")
-                    return Response({
-                        'status': 'success',
-                        'message': 'Note created successfully.',
-                        'data': serializer.data
-                    }, status=status.HTTP_201_CREATED)
-                else:
-                    log_warning(f"Invalid note creation attempt by user {request.user.username}", 
-                               {"errors": serializer.errors})
-                    return Response({
-                        'status': 'error',
-                        'message': 'Invalid data provided.',
-                        'errors': serializer.errors
-                    }, status=status.HTTP_400_BAD_REQUEST)
-            except Exception as e:
-                log_error(f"Error creating note for user {request.user.username}", e)
+        try:
+            serializer = self.get_serializer(data=request.data)
+            if serializer.is_valid():
+                note = serializer.save(author=request.user)
+                log_info("Note created successfully - ID: %s, Title: '%s', Author: %s",
+                         note.id, note.title, request.user.username)
+                # Build the body from the saved instance instead of
+                # serializer.data, which re-runs to_representation
                 return Response({
-                    'status': 'error', 
-                    'message': str(e)
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                    'status': 'success',
+                    'message': 'Note created successfully.',
+                    'data': {
+                        'id': note.id,
+                        'title': note.title,
+                        'content': note.content,
+                        'created_at': note.created_at,
+                        'author': note.author_id,
+                        'author_username': request.user.username,
+                        'author_id': note.author_id
+                    }
+                }, status=status.HTTP_201_CREATED)
+            else:
+                log_warning("Invalid note creation attempt by user %s - errors: %s",
+                            request.user.username, serializer.errors)
+                return Response({
+                    'status': 'error',
+                    'message': 'Invalid data provided.',
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+        except DatabaseError as e:
+            log_error(f"Error creating note for user {request.user.username}", e)
+            return Response({
+                'status': 'error',
+                'message': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class NoteDelete(generics.DestroyAPIView):
     serializer_class = NoteSerializer
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        with LogFunctionCall("NoteDelete.get_queryset", self.request.user.id):
-            try:
-                if self.request.user.is_staff or self.request.user.is_superuser:
-                    log_info(f"Admin user {self.request.user.username} accessing delete queryset")
-                    return Note.objects.all()
-                else:
-                    log_warning(f"Non-admin user {self.request.user.username} attempted to access delete queryset")
-                    return Note.objects.none()
-            except Exception as e:
-                log_error("Error in delete queryset", e)
-                raise
+        if _is_admin(self.request.user):
+            return Note.objects.select_related('author')
+        log_warning("Non-admin user %s attempted to access delete queryset",
+                    self.request.user.username)
+        return Note.objects.none()
     
+    @log_function_call("NoteDelete.destroy")
     def destroy(self, request, *args, **kwargs):
-        with LogFunctionCall("NoteDelete.destroy", request.user.id):
-            try:
-                if not (request.user.is_staff or request.user.is_superuser):
-                    log_warning(f"Unauthorized delete attempt by user {request.user.username}")
-                    return Response({
-                        'status': 'error',
-                        'message': 'Only administrators can delete notes.'
-                    }, status=status.HTTP_403_FORBIDDEN)
-                
-                try:
-                    note = self.get_object()
-                    note_info = {
-                        "id": note.id,
-                        "title": note.title,
-                        "author": note.author.username
-                    }
-                except Note.DoesNotExist:
-                    log_warning(f"Note not found for deletion by admin {request.user.username}")
-                    return Response({
-                        'status': 'error',
-                        'message': 'Note not found.'
-                    }, status=status.HTTP_404_NOT_FOUND)
-                
-                # Perform the deletion
-                super().destroy(request, *args, **kwargs)
-                log_info(f"Note deleted successfully by admin {request.user.username}", note_info)
-                
-                return Response({
-                    'status': 'success',
-                    'message': f"Note '{note_info['title']},' by: '{note_info['author']}' has been deleted successfully.", #kind of, migth change it later
-                    'data': {
-                        'deleted_note': note_info
-                    }
-                }, status=status.HTTP_200_OK)
-                
-            except Exception as e:
-                log_error(f"Error deleting note for admin {request.user.username}", e)
-                return Response({
-                    'status': 'error', 
-                    'message': str(e)
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if not _is_admin(request.user):
+            log_warning(f"Unauthorized delete attempt by user {request.user.username}")
+            return Response({
+                'status': 'error',
+                'message': 'Only administrators can delete notes.'
+            }, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            # Single fetch: author comes select_related from the
+            # queryset and the instance is deleted directly, instead
+            # of letting super().destroy() re-run get_object()
+            note = self.get_object()
+        except Http404:
+            # get_object raises Http404, not Note.DoesNotExist
+            log_warning(f"Note not found for deletion by admin {request.user.username}")
+            return Response({
+                'status': 'error',
+                'message': 'Note not found.'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        note_info = {
+            "id": note.id,
+            "title": note.title,
+            "author": note.author.username
+        }
+        try:
+            self.perform_destroy(note)
+        except DatabaseError as e:
+            log_error(f"Error deleting note for admin {request.user.username}", e)
+            return Response({
+                'status': 'error',
+                'message': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        log_info("Note deleted successfully by admin %s - %s",
+                 request.user.username, note_info)
+
+        return Response({
+            'status': 'success',
+            'message': f"Note '{note_info['title']},' by: '{note_info['author']}' has been deleted successfully.", #kind of, migth change it later
+            'data': {
+                'deleted_note': note_info
+            }
+        }, status=status.HTTP_200_OK)
 
 class CreateUserView(generics.CreateAPIView):
     serializer_class = UserSerializer
     permission_classes = [AllowAny]
     
+    @log_function_call("CreateUserView.create")
     def create(self, request, *args, **kwargs):
-        with LogFunctionCall("CreateUserView.create"):
-            try:
-                serializer = self.get_serializer(data=request.data)
-                if serializer.is_valid():
-                    user = serializer.save()
-                    log_info(f"New user registered successfully - Username: {user.username}, ID: {user.id}")
-                    return Response({
-                        'status': 'success',
-                        'message': 'User registered successfully.',
-                        'data': {
-                            'id': user.id,
-                            'username': user.username
-                        }
-                    }, status=status.HTTP_201_CREATED)
-                else:
-                    log_warning("Invalid user registration attempt", {"errors": serializer.errors})
-                    return Response({
-                        'status': 'error',
-                        'message': 'Invalid registration data.',
-                        'errors': serializer.errors
-                    }, status=status.HTTP_400_BAD_REQUEST)
-            except Exception as e:
-                log_error("Error during user registration", e)
+        try:
+            serializer = self.get_serializer(data=request.data)
+            if serializer.is_valid():
+                user = serializer.save()
+                log_info("New user registered successfully - Username: %s, ID: %s",
+                         user.username, user.id)
                 return Response({
-                    'status': 'error', 
-                    'message': str(e)
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                    'status': 'success',
+                    'message': 'User registered successfully.',
+                    'data': {
+                        'id': user.id,
+                        'username': user.username
+                    }
+                }, status=status.HTTP_201_CREATED)
+            else:
+                log_warning("Invalid user registration attempt - errors: %s", serializer.errors)
+                return Response({
+                    'status': 'error',
+                    'message': 'Invalid registration data.',
+                    'errors': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+        except DatabaseError as e:
+            log_error("Error during user registration", e)
+            return Response({
+                'status': 'error',
+                'message': str(e)
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class CurrentUserView(APIView):
     permission_classes = [IsAuthenticated]
     
+    @log_function_call("CurrentUserView.get")
     def get(self, request):
-        with LogFunctionCall("CurrentUserView.get", request.user.id):
-            try:
-                user_data = {
-                    'id': request.user.id,
-                    'username': request.user.username,
-                    'is_admin': request.user.is_staff or request.user.is_superuser,
-                    'is_staff': request.user.is_staff,
-                    'is_superuser': request.user.is_superuser
-                }
-                log_debug(f"User info retrieved for {request.user.username}")
-                return Response({
-                    'status': 'success',
-                    'message': 'User information retrieved successfully.',
-                    'data': user_data
-                }, status=status.HTTP_200_OK)
-            except Exception as e:
-                log_error(f"Error retrieving user info for {request.user.username}", e)
-                return Response({
-                    'status': 'error', 
-                    'message': str(e)
-                }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
\ No newline at end of file
+        # Tokens issued by TokenObtainPairWithClaimsSerializer carry
+        # everything this endpoint returns, so answer straight from
+        # the validated token without any DB read
+        token = request.auth
+        if token is not None and 'is_staff' in token:
+            user_data = {
+                # simplejwt stores user_id as a string in the payload;
+                # the frontend strict-compares this against note.author_id
+                'id': int(token['user_id']),
+                'username': token['username'],
+                'is_admin': token['is_staff'] or token['is_superuser'],
+                'is_staff': token['is_staff'],
+                'is_superuser': token['is_superuser']
+            }
+        else:
+            # Older tokens without the claims: fall back to the
+            # cached payload (invalidated by signals.py on user save)
+            user = request.user
+            user_data = cache.get_or_set(f"curuser:{user.id}", lambda: {
+                'id': user.id,
+                'username': user.username,
+                'is_admin': _is_admin(user),
+                'is_staff': user.is_staff,
+                'is_superuser': user.is_superuser
+            }, 300)
+        response = Response({
+            'status': 'success',
+            'message': 'User information retrieved successfully.',
+            'data': user_data
+        }, status=status.HTTP_200_OK)
+        response['Cache-Control'] = 'private, max-age=60'
+        return response
\ No newline at end of file
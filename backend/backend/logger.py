@@ -1,5 +1,45 @@
+import atexit
 import os
+from logging.config import ConvertingList
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import Queue
+
+
+class QueueListenerHandler(QueueHandler):
+    """QueueHandler that owns a background QueueListener for its targets.
+
+    Log records are put on an in-memory queue and written to the file
+    handlers by the listener thread, so disk I/O never blocks the
+    request thread.
+    """
+
+    def __init__(self, handlers, respect_handler_level=True):
+        super().__init__(Queue(-1))
+        self._handlers = handlers
+        self._respect_handler_level = respect_handler_level
+        self.listener = None
+
+    def _ensure_listener(self):
+        # Deferred until the first record: dictConfig configures handlers
+        # in name order, so cfg:// references to handlers that sort after
+        # this one aren't real handler objects yet at __init__ time
+        handlers = self._handlers
+        if isinstance(handlers, ConvertingList):
+            handlers = [handlers[i] for i in range(len(handlers))]
+        self.listener = QueueListener(
+            self.queue, *handlers,
+            respect_handler_level=self._respect_handler_level
+        )
+        self.listener.start()
+        atexit.register(self.listener.stop)
+
+    def emit(self, record):
+        with self.lock:
+            if self.listener is None:
+                self._ensure_listener()
+        super().emit(record)
+
 
 def get_logging_config(base_dir):
 
@@ -68,25 +108,45 @@ def get_logging_config(base_dir):
                 "formatter": "verbose",
                 "encoding": "utf-8",
             },
+            # All file writes go through queues so disk I/O happens on
+            # background threads, never on the request thread. One queue
+            # per logger, wrapping that logger's original file targets,
+            # so each level keeps writing to exactly the same files
+            "queue_general": {
+                "()": "backend.logger.QueueListenerHandler",
+                "handlers": ["cfg://handlers.general_file"],
+            },
+            "queue_info": {
+                "()": "backend.logger.QueueListenerHandler",
+                "handlers": ["cfg://handlers.info_file", "cfg://handlers.general_file"],
+            },
+            "queue_warning": {
+                "()": "backend.logger.QueueListenerHandler",
+                "handlers": ["cfg://handlers.warning_file", "cfg://handlers.general_file"],
+            },
+            "queue_error": {
+                "()": "backend.logger.QueueListenerHandler",
+                "handlers": ["cfg://handlers.error_file", "cfg://handlers.general_file"],
+            },
         },
         'loggers': {
             'notes_app': {
-                'handlers': ['console', 'general_file'],
+                'handlers': ['console', 'queue_general'],
                 'level': 'DEBUG',
                 'propagate': False,
             },
             'notes_app.info': {
-                'handlers': ['info_file', 'general_file'],
+                'handlers': ['queue_info'],
                 'level': 'INFO',
                 'propagate': False,
             },
             'notes_app.warning': {
-                'handlers': ['warning_file', 'general_file'],
+                'handlers': ['queue_warning'],
                 'level': 'WARNING',
                 'propagate': False,
             },
             'notes_app.error': {
-                'handlers': ['error_file', 'general_file'],
+                'handlers': ['queue_error'],
                 'level': 'ERROR',
                 'propagate': False,
             },
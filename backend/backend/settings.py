@@ -37,11 +37,12 @@ ALLOWED_HOSTS = ["*"]
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "api.authentication.AdminFlagJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
+    "EXCEPTION_HANDLER": "api.exceptions.envelope_handler",
 }
 
 SIMPLE_JWT = {
@@ -68,6 +69,8 @@ MIDDLEWARE = [
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
+    # Sets ETags on GET responses and turns If-None-Match matches into 304s
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "api.middleware.AuthenticationLoggingMiddleware",  # Add our custom middleware
@@ -102,6 +105,10 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Reuse connections across requests instead of reconnecting each
+        # time; matters most when pointed at Postgres in production
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -151,4 +158,8 @@ CORS_ALLOW_ALL_ORIGINS = True
 CORS_ALLOW_CREDENTIALS = True
 
 # Logging Configuration
-LOGGING = get_logging_config(BASE_DIR)
\ No newline at end of file
+LOGGING = get_logging_config(BASE_DIR)
+
+# Per-request "entering/completed" log lines are skipped outside DEBUG
+# unless this is turned on (see api.utils.logging_utility.LogFunctionCall)
+VERBOSE_API_LOGGING = os.getenv('VERBOSE_API_LOGGING', 'False') == 'True'
\ No newline at end of file
@@ -1,12 +1,13 @@
 from django.contrib import admin
 from django.urls import path, include
 from api.views import CreateUserView
+from api.serializers import TokenObtainPairWithClaimsSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/user/register/', CreateUserView.as_view(), name='register'),
-    path('api/token/', TokenObtainPairView.as_view(), name='get_token'),
+    path('api/token/', TokenObtainPairView.as_view(serializer_class=TokenObtainPairWithClaimsSerializer), name='get_token'),
     path('api/token/refresh/', TokenRefreshView.as_view(), name='refresh'),
     path('api-auth/', include('rest_framework.urls')),
     path('api/', include('api.urls')),   
@@ -41,8 +41,9 @@ function Home(){
             .then((res) => {
                 // Handle standardized response format
                 if (res.data.status === 'success') {
-                    setNotes(res.data.data)
-                    console.log("Notes data:", res.data.data)
+                    // data is now paginated: { count, next, previous, results }
+                    setNotes(res.data.data.results)
+                    console.log("Notes data:", res.data.data.results)
                 } else {
                     console.error("Error fetching notes:", res.data.message)
                     alert(res.data.message || "Error fetching notes")